@@ -1,25 +1,75 @@
+import aiohttp
+import asyncio
 import logging
 import os
 import sys
 import pymongo
-import requests
+import signal
 import string
-import threading
 import time
 import logging
-import math
-from queue import Queue
-from collections import Counter
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from bs4 import BeautifulSoup, SoupStrainer
+import matplotlib
+matplotlib.use('Agg')  # Headless backend; the plot is only ever saved to a file.
 import matplotlib.pyplot as plt
 
 mongo_uri = os.environ.get('MONGODB_URI')
 
+def has_class(*names):
+    """
+    Build a class matcher for SoupStrainer, which sees the raw unsplit class
+    string at parse time (unlike find_all, which splits multi-valued classes).
+    """
+
+    wanted = set(names)
+    return lambda class_attr: class_attr is not None and not wanted.isdisjoint(class_attr.split())
+
+# Restrict parsing to the subtrees the extractors actually read.
+LISTING_STRAINER = SoupStrainer('article', class_=has_class('col-12'))
+DETAIL_STRAINER = SoupStrainer(['img', 'div'], class_=has_class('onresim', 'post_line', 'yazibio'))
+
+# Translation table for Turkish characters whose upper case differs from str.upper().
+TR_UPPER_TABLE = str.maketrans({
+    'i': 'İ',
+    'ı': 'I',
+    'ğ': 'Ğ',
+    'ü': 'Ü',
+    'ş': 'Ş',
+    'ö': 'Ö',
+    'ç': 'Ç'
+})
+
+# Combined table: deletes punctuation and upper-cases Turkish characters in one pass.
+NORMALIZE_TABLE = {**{ord(c): None for c in string.punctuation}, **TR_UPPER_TABLE}
+
+# Turkish stop words, upper-cased to match the normalized TextUpper tokens.
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tr_stopwords.txt'), encoding='utf-8') as f:
+    TR_STOPWORDS = frozenset(word.translate(TR_UPPER_TABLE).upper() for word in f.read().split())
+
+
+@dataclass
+class DetailRecord:
+    """
+    Data extracted from one news detail page.
+    """
+
+    img_urls: list
+    text: str
+    publish_date: str
+    update_date: str
+
 class NewsScraper:
     """
     Class to scrape news articles and handle MongoDB operations for news data and performance stats.
     """
 
+    # Indexes are declared once per process, not per scrape cycle.
+    _indexes_created = False
+
     def __init__(self, db_name):
         """
         Initialize NewsScraper with the specified database name.
@@ -29,11 +79,14 @@ class NewsScraper:
             mongo_uri = os.environ.get('MONGODB_URI')
             
             if mongo_uri:
-                self.client = pymongo.MongoClient(mongo_uri)
+                # Pool sized for scraper concurrency; the client is reused across cycles.
+                self.client = pymongo.MongoClient(mongo_uri, maxPoolSize=40, minPoolSize=20,
+                                                  retryWrites=True, w=1)
                 self.db = self.client[db_name]
                 self.news_collection = self.db["news"]
                 self.performance_collection = self.db["stats"]
                 self.word_frequency_collection = self.db["word_frequency"]
+                self.create_indexes()
             else:
                 sys.exit("MONGODB_URI environment variable not found!")
 
@@ -48,7 +101,36 @@ class NewsScraper:
         self.successful_requests = 0
         self.failed_requests = 0
         self.start_time = time.time()
-        self.lock = threading.Lock()
+        # Single-threaded event loop, so plain int counters need no lock.
+        self.semaphore = None
+        self.pending_news = []
+        self.bulk_batch_size = 100
+        # Dedicated parser pool, one thread per core, created once for the
+        # process. Kept separate from the loop's default executor so threads
+        # blocked in input() can never starve parsing.
+        self.parse_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+    def create_indexes(self):
+        """
+        Declare all collection indexes up front, one round trip per collection,
+        so no schema work happens on the scraping hot path.
+        """
+
+        if NewsScraper._indexes_created:
+            return
+
+        # The unique URL index also backs the read-free $setOnInsert upserts.
+        self.news_collection.create_indexes([
+            pymongo.IndexModel([("URL", pymongo.ASCENDING)], unique=True),
+            pymongo.IndexModel([("Update Date", pymongo.ASCENDING)])
+        ])
+        self.word_frequency_collection.create_indexes([
+            pymongo.IndexModel([("Word", pymongo.ASCENDING)], unique=True)
+        ])
+        self.performance_collection.create_indexes([
+            pymongo.IndexModel([("Timestamp", pymongo.ASCENDING)])
+        ])
+        NewsScraper._indexes_created = True
 
     def save_performance_data(self, request_count, successful_requests, failed_requests):
         """
@@ -77,7 +159,7 @@ class NewsScraper:
 
     def save_to_mongodb(self, the_news_url, header, summary, text, img_url_list, publish_date, update_date):
         """
-        Save news data to MongoDB.
+        Queue news data for bulk upsert into MongoDB.
 
         Parameters:
         - the_news_url (str): URL of the news article.
@@ -89,22 +171,35 @@ class NewsScraper:
         - update_date (str): Update date of the news article.
         """
 
-        existing_news = self.news_collection.find_one({"URL": the_news_url})
+        the_news = {
+            "URL": the_news_url,
+            "Header": header,
+            "Summary": summary,
+            "Text": text,
+            # Pre-normalized copy so word counting can run server-side.
+            "TextUpper": text.translate(NORMALIZE_TABLE).upper(),
+            "Image URLs": img_url_list,
+            # Stored as BSON dates so aggregations can group and index them directly.
+            "Publish Date": self.parse_date(publish_date),
+            "Update Date": self.parse_date(update_date)
+        }
+        # $setOnInsert keeps existing documents untouched, so no pre-read is needed.
+        self.pending_news.append(pymongo.UpdateOne({"URL": the_news_url},
+                                                   {"$setOnInsert": the_news}, upsert=True))
+        if len(self.pending_news) >= self.bulk_batch_size:
+            self.flush_pending_news()
+
+    def flush_pending_news(self):
+        """
+        Write all buffered news upserts to MongoDB in one bulk operation.
+        """
 
-        if existing_news is None:
-            the_news = {
-                "URL": the_news_url,
-                "Header": header,
-                "Summary": summary,
-                "Text": text,
-                "Image URLs": img_url_list,
-                "Publish Date": publish_date if publish_date else 'No information',
-                "Update Date": update_date if update_date else 'No information'
-            }
-            self.news_collection.insert_one(the_news)
-            logging.info(f"{the_news_url} successfully added to MongoDB.")
-        else:
-            logging.info(f"{the_news_url} already exists in MongoDB. Skipped.")
+        if not self.pending_news:
+            return
+        result = self.news_collection.bulk_write(self.pending_news, ordered=False)
+        skipped = len(self.pending_news) - result.upserted_count
+        logging.info(f"{result.upserted_count} news added to MongoDB, {skipped} already existed. Skipped.")
+        self.pending_news = []
 
     def extract_news_details(self, the_news):
         """
@@ -116,86 +211,83 @@ class NewsScraper:
         summary = the_news.find('div', class_='haber-content').find('div', class_='haber-desc').text.strip()
         return the_news_url, header, summary
     
-    def extract_image_urls(self, detail_soup):
+    def parse_date(self, date_str):
         """
-        Extract image URLs from parsed news content.
+        Parse an ISO date string from the page into a datetime, or None.
         """
 
-        img_url_list = []
-        haber_main_img = detail_soup.find_all('img', class_='onresim wp-post-image')
-        for img in haber_main_img:
-            src = img['data-src']
-            img_url_list.append(src)
-        detay_img_tags = detail_soup.select('div.post_line img')
-        for img in detay_img_tags:
-            src = img['src']
-            if not src.startswith('data:image/svg+xml;base64') and src != '#':
-                img_url_list.append(src)
-        return img_url_list  
+        if not date_str:
+            return None
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            logging.warning(f"Unparseable date: {date_str}")
+            return None
 
-    def extract_text(self, detail_soup):
-        """
-        Extract text content from parsed news content.
+    def extract_detail(self, detail_soup):
         """
+        Extract image URLs, text content, and dates from parsed news content.
 
-        return ' '.join([p.text.strip() for p in detail_soup.select('div.post_line div.yazi_icerik p')])
+        Walks the article subtree once and dispatches per element instead of
+        running a separate full-tree query per field.
 
-    def extract_date(self, detail_soup):
-        """
-        Extract publish and update dates from parsed news content.
+        Returns:
+        - DetailRecord: Image URLs, text, publish date, and update date.
         """
 
-        dates = detail_soup.select('div.yazibio span.tarih time')
+        img_url_list = []
+        text_parts = []
         publish_date = ''
         update_date = ''
-        for date in dates:
-            datetime_attr = date['datetime']
-            if 'Yayınlanma' in date.parent.text:
-                publish_date = datetime_attr
-            elif 'Güncelleme' in date.parent.text:
-                update_date = datetime_attr
-        return publish_date, update_date
-    
 
-    def upper_tr(self, text):
-        """
-        Convert Turkish characters to upper case.
-        """
+        haber_main_img = detail_soup.find_all('img', class_='onresim wp-post-image')
+        for img in haber_main_img:
+            img_url_list.append(img['data-src'])
+
+        post_line = detail_soup.find('div', class_='post_line')
+        if post_line is not None:
+            for el in post_line.descendants:
+                if el.name == 'img':
+                    src = el.get('src', '')
+                    if src and not src.startswith('data:image/svg+xml;base64') and src != '#':
+                        img_url_list.append(src)
+                elif el.name == 'p' and el.find_parent('div', class_='yazi_icerik') is not None:
+                    text_parts.append(el.text.strip())
+
+        yazibio = detail_soup.find('div', class_='yazibio')
+        if yazibio is not None:
+            for date in yazibio.select('span.tarih time'):
+                datetime_attr = date['datetime']
+                if 'Yayınlanma' in date.parent.text:
+                    publish_date = datetime_attr
+                elif 'Güncelleme' in date.parent.text:
+                    update_date = datetime_attr
+
+        return DetailRecord(img_url_list, ' '.join(text_parts), publish_date, update_date)
 
-        # Dictionary for Turkish characters
-        tr_to_upper = {
-            'i': 'İ',
-            'ı': 'I',
-            'ğ': 'Ğ',
-            'ü': 'Ü',
-            'ş': 'Ş',
-            'ö': 'Ö',
-            'ç': 'Ç'
-        }
 
-        # Convert characters
-        text = ''.join(tr_to_upper.get(c, c).upper() for c in text)
-        return text
 
     def get_top_10_words(self, news_collection):
         """
         Get the top 10 most used words from the news text stored in MongoDB.
+
+        Counting runs server-side over the pre-normalized TextUpper field,
+        so the article corpus is never shipped to the client.
         """
 
-        all_text = ""
-        # Concatenate all news texts
-        for document in news_collection.find():
-            all_text += document['Text'] + " "
+        pipeline = [
+            {"$project": {"words": {"$split": [{"$ifNull": ["$TextUpper", ""]}, " "]}}},
+            {"$unwind": "$words"},
+            # Drop stop words and 1-2 letter tokens before they hit $group.
+            {"$match": {"words": {"$nin": list(TR_STOPWORDS)},
+                        "$expr": {"$gt": [{"$strLenCP": "$words"}, 2]}}},
+            {"$group": {"_id": "$words", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1}},
+            {"$limit": 10},
+        ]
 
-        # Split the text and remove punctuation
-        translator = str.maketrans('', '', string.punctuation)
-        all_text = all_text.translate(translator)
-        words = all_text.split()
-        # To avoid case sensitivity, all words were converted to lowercase.
-        words = [self.upper_tr(word) for word in words]
-        # Calculate word counts
-        word_counts = Counter(words)
-        top_10_words = word_counts.most_common(10)
+        top_10_words = [(document['_id'], document['count'])
+                        for document in news_collection.aggregate(pipeline)]
 
         return top_10_words
     
@@ -207,184 +299,230 @@ class NewsScraper:
         words = [word[0] for word in top_10_words]
         counts = [count[1] for count in top_10_words]
 
-        plt.figure(figsize=(10, 6))
-        plt.bar(words, counts, color='skyblue')
-        plt.xlabel('Words')
-        plt.ylabel('Counts')
-        plt.title('Top 10 Most Used Words in News Text')
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        plt.savefig('top_10_words.png')
+        fig, ax = plt.subplots(figsize=(10, 6))
+        ax.bar(words, counts, color='skyblue')
+        ax.set_xlabel('Words')
+        ax.set_ylabel('Counts')
+        ax.set_title('Top 10 Most Used Words in News Text')
+        ax.tick_params(axis='x', rotation=45)
+        fig.tight_layout()
+        fig.savefig('top_10_words.png')
+        # Release the figure; otherwise each 20-minute cycle leaks one.
+        plt.close(fig)
 
     def add_top_10_words_to_db(self, top_10_words):
         """
         Add the top 10 most used words to MongoDB in a 'word_frequency' collection.
         """
 
-        existing_words = {word['Word']: word['Count'] for word in self.word_frequency_collection.find()}
-        for word, count in top_10_words:
-            if word in existing_words:
-                # If the word exists, update the count
-                new_count = existing_words[word] + count
-                self.word_frequency_collection.update_one(
-                    {"Word": word},
-                    {"$set": {"Count": new_count}}
-                )
-                logging.info(f"Word '{word}' count updated in MongoDB 'word_frequency' collection.")
-            else:
-                # If the word does not exist, insert it
-                word_data = {
-                    "Word": word,
-                    "Count": count
-                }
-                self.word_frequency_collection.insert_one(word_data)
-                logging.info(f"Word '{word}' added to MongoDB 'word_frequency' collection.")
+        # Nothing scraped this cycle: bulk_write rejects an empty op list, and
+        # an empty $nin would wipe the whole collection.
+        if not top_10_words:
+            return
+
+        # $inc upserts insert missing words and bump existing counts in one round trip.
+        ops = [pymongo.UpdateOne({"Word": word}, {"$inc": {"Count": count}}, upsert=True)
+               for word, count in top_10_words]
+        self.word_frequency_collection.bulk_write(ops, ordered=False)
 
         # Delete old entries that are no longer in the top 10 list
-        top_10_words_set = {word[0] for word in top_10_words}
-        for word in existing_words:
-            if word not in top_10_words_set:
-                self.word_frequency_collection.delete_one({"Word": word})
-                logging.info(f"Word '{word}' removed from MongoDB 'word_frequency' collection.")
+        top_10_words_set = [word[0] for word in top_10_words]
+        delete_result = self.word_frequency_collection.delete_many({"Word": {"$nin": top_10_words_set}})
+        logging.info(f"{len(ops)} words upserted and {delete_result.deleted_count} stale words removed "
+                     f"from MongoDB 'word_frequency' collection.")
 
     def print_grouped_data_by_update_date(self, news_collection):
         """
         Print grouped data based on update dates from the MongoDB collection.
         """
         pipeline = [
-            {"$match": {"Update Date": {"$exists": True, "$ne": None}}},
-            {"$group": {"_id": {"$dateToString": {"format": "%Y-%m-%d", "date": {"$dateFromString": {"dateString": "$Update Date"}}}}, "count": {"$sum": 1}}}
+            # Match on BSON type: legacy documents store the date as a string
+            # ('No information' or raw ISO text) and would break $dateToString.
+            {"$match": {"Update Date": {"$type": "date"}}},
+            {"$group": {"_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$Update Date"}}, "count": {"$sum": 1}}}
         ]
 
         grouped_data = list(news_collection.aggregate(pipeline))
         for data in grouped_data:
             print(f"Update Date: {data['_id']} - Count: {data['count']}")
 
-    def get_parsed_page_content(self, url):
+    async def fetch(self, session, url):
+        """
+        Fetch the raw HTML of the specified URL through the shared session.
+
+        Parameters:
+        - session (aiohttp.ClientSession): Session used for the request.
+        - url (str): URL of the web page to fetch.
+
+        Returns:
+        - str: Raw HTML content of the page.
+        """
+
+        async with self.semaphore:
+            async with session.get(url) as response:
+                self.request_count += 1
+                return await response.text()
+
+    async def get_parsed_page_content(self, session, url, parse_only=None):
         """
         Get parsed page content from the specified URL.
 
         Parameters:
+        - session (aiohttp.ClientSession): Session used for the request.
         - url (str): URL of the web page to parse.
+        - parse_only (SoupStrainer): Optional strainer limiting which tags are parsed.
 
         Returns:
         - BeautifulSoup object: Parsed page content.
         """
 
-        response = requests.get(url)
-        with self.lock:
-            self.request_count += 1  # Update with locking mechanism
-        return BeautifulSoup(response.text, 'html.parser') 
+        html = await self.fetch(session, url)
+        # Parse in a worker thread so HTML parsing overlaps with network waits.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.parse_executor,
+                                          partial(BeautifulSoup, html, 'lxml', parse_only=parse_only))
 
     def scrape_news(self):
             """
             Scrape news articles from the specified website and store data in MongoDB.
             """
-            
-            max_threads = 20
-            # Divide the number of pages by the number of threads.
-            last_page = 50  # 50 Pages determined
-            pages_per_thread = math.ceil(last_page / max_threads)  # Ceiling process to share pages to threads
-            
-            # Start threads
-            threads = []
-            start_page = 1
-            is_reached_page_limit = False
-            for _ in range(max_threads):
-                end_page = start_page + pages_per_thread
-                if(end_page >= last_page + 1):
-                    end_page = last_page + 1
-                    is_reached_page_limit = True
-                thread = threading.Thread(target=self.worker, args = (start_page, end_page))
-                threads.append(thread)
-                thread.start()
-                if is_reached_page_limit:
-                    break
-                start_page = start_page + pages_per_thread
-
-            # Wait for all threads to finish
-            for thread in threads:
-                thread.join()
-
-            # Save performance data
-            self.save_performance_data(self.request_count, self.successful_requests, self.failed_requests)
-       
-    def worker(self, start_page, end_page):
-        """
-        Scrape news articles from a website and save data to MongoDB.
-
-        Process URLs in the queue, fetch news details, and update MongoDB collections.
-        Implements locking for thread-safe updates to request counts and statistics.
-        """
-
-        for page_num in range(start_page, end_page):
+
+            asyncio.run(self.scrape_news_async())
+
+    async def scrape_news_async(self):
+        """
+        Run the scraping event loop: fetch all category pages concurrently
+        and fan out a task per discovered article.
+        """
+
+        last_page = 50  # 50 Pages determined
+        max_concurrent_requests = 50
+        self.semaphore = asyncio.Semaphore(max_concurrent_requests)
+
+        # The scraper lives across cycles now, so stats are reset per run.
+        self.request_count = 0
+        self.successful_requests = 0
+        self.failed_requests = 0
+        self.start_time = time.time()
+
+        # Keep-alive connection reuse: one TLS handshake per pooled socket
+        # instead of per request.
+        connector = aiohttp.TCPConnector(limit=max_concurrent_requests, limit_per_host=20,
+                                         keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=10)
+        # Shared queue of page numbers: workers pull the next page as soon as
+        # they finish one, so slow pages never leave the others idle.
+        page_queue = asyncio.Queue()
+        for page_num in range(1, last_page + 1):
+            page_queue.put_nowait(page_num)
+
+        max_page_workers = 10
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [self.worker(session, page_queue) for _ in range(max_page_workers)]
+            await asyncio.gather(*tasks)
+
+        self.flush_pending_news()
+
+        # Save performance data
+        self.save_performance_data(self.request_count, self.successful_requests, self.failed_requests)
+
+    async def worker(self, session, page_queue):
+        """
+        Pull category pages from the shared queue until it is empty. For each
+        listing, process all of its articles concurrently and update MongoDB
+        collections.
+        """
+
+        while True:
+            try:
+                page_num = page_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
             url = f'https://turkishnetworktimes.com/kategori/gundem/page/{page_num}/'
             try:
-                soup = self.get_parsed_page_content(url)
+                soup = await self.get_parsed_page_content(session, url, parse_only=LISTING_STRAINER)
                 news = soup.find_all('article', class_='col-12')
-                the_news_url = None
-                for the_news in news:
-                    try:
-                        the_news_url, header, summary = self.extract_news_details(the_news)
-                        detail_soup = self.get_parsed_page_content(the_news_url)        
-                        img_url_list = self.extract_image_urls(detail_soup)
-                        text = self.extract_text(detail_soup)
-                        publish_date, update_date = self.extract_date(detail_soup)
-                        self.save_to_mongodb(the_news_url, header, summary, text, img_url_list, publish_date, update_date)
-                        with self.lock:
-                            self.successful_requests += 1  # Update with locking mechanism
-                    
-                    except Exception as e:
-                        logging.error(f"News URL: {the_news_url}. Error: {str(e)}")
-                        with self.lock:
-                            self.failed_requests += 1  # Update with locking mechanism
+                await asyncio.gather(*[self.process_article(session, the_news) for the_news in news])
             except Exception as e:
                 logging.error(f"Page URL: {url}. Error: {str(e)}")
-                with self.lock:
-                    self.failed_requests += 1  # Update with locking mechanism
+                self.failed_requests += 1
 
-def get_user_input():
-    global user_choice
-    user_choice = input("Would you like to run print_grouped_data_by_update_date function? Answer the question in 10 seconds (1 for Yes / 0 for No): ")
+    async def process_article(self, session, the_news):
+        """
+        Fetch one article's detail page, extract its data, and save it to MongoDB.
+        """
 
-if __name__ == "__main__":
+        the_news_url = None
+        try:
+            the_news_url, header, summary = self.extract_news_details(the_news)
+            detail_soup = await self.get_parsed_page_content(session, the_news_url, parse_only=DETAIL_STRAINER)
+            detail = self.extract_detail(detail_soup)
+            self.save_to_mongodb(the_news_url, header, summary, detail.text, detail.img_urls,
+                                 detail.publish_date, detail.update_date)
+            self.successful_requests += 1
+
+        except Exception as e:
+            logging.error(f"News URL: {the_news_url}. Error: {str(e)}")
+            self.failed_requests += 1
+
+async def get_user_choice():
+    """
+    Ask whether to run print_grouped_data_by_update_date, defaulting to '0'
+    if no answer arrives within 10 seconds.
+    """
+
+    prompt = "Would you like to run print_grouped_data_by_update_date function? Answer the question in 10 seconds (1 for Yes / 0 for No): "
     try:
-        user_choice = '0'  # Default value
-        threads_list = []
-        while True:
-            if not os.path.exists('logs'):
-                os.makedirs('logs', exist_ok=True)
-
-            log_file = os.path.join('logs', 'logs.log')
-            logging.basicConfig(filename=log_file, filemode='a', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
-
-            db_name = "batuhan_kaya"
-            news_scraper = NewsScraper(db_name)
-            news_scraper.scrape_news()
-
-            top_10_words = news_scraper.get_top_10_words(news_scraper.news_collection)
-            print("Top 10 Words:", top_10_words)
-            news_scraper.plot_and_save_top_10_words(top_10_words)
-            news_scraper.add_top_10_words_to_db(top_10_words)
-            # print_grouped_data_by_update_date is optional function 
-            user_input_thread = threading.Thread(target=get_user_input)
-            user_input_thread.start()
-            # Wait for 10 seconds or until the user input is received
-            user_input_thread.join(timeout=10)
-            # Check if user input is received
-            if user_input_thread.is_alive():
-                user_choice = '0'  # If no input received in 10 seconds, use default value (0)
-                print("Default choice (0) selected as no input received.")
-            
-            if user_choice == '1':
-                news_scraper.print_grouped_data_by_update_date(news_scraper.news_collection)
-            elif user_choice != '0':
-                print("Invalid input. Not running the function.")
-        
-            time.sleep(1200)  # Web scraping starts every 20 minutes
-
-    except KeyboardInterrupt:
-        for thread in threads_list:
-                thread.join()
-        print("Web scraping is stopping.")
+        return await asyncio.wait_for(asyncio.to_thread(input, prompt), timeout=10)
+    except (asyncio.TimeoutError, EOFError):
+        # No answer within 10 seconds, or stdin is not interactive (e.g. the
+        # Dockerfile runs without a tty): use default value (0)
+        print("Default choice (0) selected as no input received.")
+        return '0'
+
+async def main():
+    """
+    Run the scrape cycle every 20 minutes on a single long-lived scraper,
+    stopping cleanly on SIGINT.
+    """
+
+    db_name = "batuhan_kaya"
+    # One scraper (and one MongoClient connection pool) reused across cycles.
+    news_scraper = NewsScraper(db_name)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, stop_event.set)
+
+    while not stop_event.is_set():
+        await news_scraper.scrape_news_async()
+
+        top_10_words = news_scraper.get_top_10_words(news_scraper.news_collection)
+        print("Top 10 Words:", top_10_words)
+        news_scraper.plot_and_save_top_10_words(top_10_words)
+        news_scraper.add_top_10_words_to_db(top_10_words)
+
+        # print_grouped_data_by_update_date is optional function
+        user_choice = await get_user_choice()
+        if user_choice == '1':
+            news_scraper.print_grouped_data_by_update_date(news_scraper.news_collection)
+        elif user_choice != '0':
+            print("Invalid input. Not running the function.")
+
+        # Web scraping starts every 20 minutes
+        try:
+            await asyncio.wait_for(stop_event.wait(), timeout=1200)
+        except asyncio.TimeoutError:
+            pass
+
+    print("Web scraping is stopping.")
+
+if __name__ == "__main__":
+    if not os.path.exists('logs'):
+        os.makedirs('logs', exist_ok=True)
+
+    log_file = os.path.join('logs', 'logs.log')
+    logging.basicConfig(filename=log_file, filemode='a', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
+
+    asyncio.run(main())
 